@@ -10,11 +10,26 @@ import argparse
 import sys
 from pathlib import Path
 
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from xlsxwriter.workbook import Workbook
+from xlsxwriter.worksheet import Worksheet
 
+import numpy as np
 import pandas as pd
 
+# Format properties shared by the worksheet styles, built once at import
+THIN_BORDER = {"border": 1}
+BOLD = {"bold": True}
+CENTER = {"align": "center"}
+CENTER_V = {"valign": "vcenter"}
+CENTER_CENTER_V = {"align": "center", "valign": "vcenter"}
+RIGHT_CENTER_V = {"align": "right", "valign": "vcenter"}
+WRAP_CENTER_V = {"text_wrap": True, "valign": "vcenter"}
+HEADER_FILL = {"bg_color": "#1F4E78", "font_color": "#FFFFFF"}
+SUMMARY_FILL = {"bg_color": "#D9E1F2"}
+DATETIME_FMT = {"num_format": "YYYY-MM-DD HH:MM:SS"}
+HRS_FMT = {"num_format": '0.00 "hrs"'}
+EUR_FMT = {"num_format": "€ #,##0.00"}
+
 
 def load_csv(file_path: Path) -> pd.DataFrame:
     """Load CSV data into a DataFrame."""
@@ -27,94 +42,75 @@ def process_data(
     hourly_fee: float = 25.0,
 ) -> pd.DataFrame:
     """Process the DataFrame to calculate durations and costs."""
+    # cache=True: sessions share many timestamps, so each unique string is
+    # parsed once and the rest are resolved by hash lookup.
     df_ = df_.assign(
-        start=lambda df_: pd.to_datetime(df_.start, format=date_format),
-        end=lambda df_: pd.to_datetime(df_.end, format=date_format),
+        start=lambda df_: pd.to_datetime(df_.start, format=date_format, cache=True),
+        end=lambda df_: pd.to_datetime(df_.end, format=date_format, cache=True),
     )
-    df_["duration_hrs"] = df_["end"].sub(df_["start"]).dt.total_seconds().div(3600)
+    df_["duration_hrs"] = (
+        df_["end"].to_numpy() - df_["start"].to_numpy()
+    ) / np.timedelta64(1, "h")
     df_["cost_eur"] = df_["duration_hrs"] * hourly_fee
     return df_
 
 
-def modify_excel(file_path: Path) -> None:
-    """Apply styling and formatting to the generated Excel file."""
-    wb = load_workbook(file_path)
-    ws = wb.active
-    last_row = ws.max_row
-
-    # Styles
-    header_fill = PatternFill(
-        start_color="1F4E78", end_color="1F4E78", fill_type="solid"
-    )
-    summary_fill = PatternFill(
-        start_color="D9E1F2", end_color="D9E1F2", fill_type="solid"
+def modify_excel(
+    workbook: Workbook, worksheet: Worksheet, dataset: pd.DataFrame
+) -> None:
+    """Write the dataset, its styling and the summary section to the worksheet."""
+    last_row = len(dataset) + 1
+
+    # Styles: every cell format is registered exactly once per workbook
+    header_fmt = workbook.add_format({**HEADER_FILL, **BOLD, **CENTER, **THIN_BORDER})
+    border_fmt = workbook.add_format(THIN_BORDER)
+    bold_fmt = workbook.add_format({**BOLD, **THIN_BORDER})
+    datetime_fmt = workbook.add_format({**DATETIME_FMT, **CENTER_V, **THIN_BORDER})
+    hrs_fmt = workbook.add_format({**HRS_FMT, **CENTER_V, **THIN_BORDER})
+    eur_fmt = workbook.add_format({**EUR_FMT, **CENTER_V, **THIN_BORDER})
+    note_fmt = workbook.add_format({**WRAP_CENTER_V, **THIN_BORDER})
+    summary_label_fmt = workbook.add_format({**BOLD, **RIGHT_CENTER_V, **THIN_BORDER})
+    summary_hrs_fmt = workbook.add_format(
+        {**HRS_FMT, **SUMMARY_FILL, **BOLD, **CENTER_CENTER_V, **THIN_BORDER}
     )
-    white_font = Font(color="FFFFFF", bold=True)
-    bold_font = Font(bold=True)
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
+    summary_cost_fmt = workbook.add_format(
+        {**EUR_FMT, **SUMMARY_FILL, **BOLD, **CENTER_CENTER_V, **THIN_BORDER}
     )
 
     # 1. Format Main Table Headers
-    for cell in ws[1]:
-        cell.fill = header_fill
-        cell.font = white_font
-        cell.alignment = Alignment(horizontal="center")
-        cell.border = thin_border
-
-    # 2. Format Data Body
-    for row in ws.iter_rows(min_row=2, max_row=last_row):
-        row[2].number_format = '0.00 "hrs"'  # Duration (Col C)
-        row[3].number_format = "€ #,##0.00"  # Cost (Col D)
-
-        for i in range(0, 5):  # Center align Duration and Cost
-            row[i].alignment = Alignment(vertical="center")
-        row[4].alignment = Alignment(wrap_text=True, vertical="center")  # Note (Col E)
-        for cell in row:
-            cell.border = thin_border
-
-    # 3. Dedicated Summary Section (Top Right)
-    total_hours_col = 8  # H
-    total_cost_col = 9  # I
-
-    ws.cell(row=1, column=total_hours_col, value="TOTAL HOURS").font = bold_font
-    ws.cell(row=1, column=total_cost_col, value="TOTAL COST").font = bold_font
-    ws.cell(row=2, column=7, value="TOTAL DUE:").font = bold_font
-    ws.cell(row=2, column=7).alignment = Alignment(
-        horizontal="right", vertical="center"
-    )
+    worksheet.write_row(0, 0, dataset.columns.tolist(), header_fmt)
+
+    # 2. Write Data Body: one call and one registered format per column.
+    # Missing values become None, which xlsxwriter writes as a blank cell that
+    # still carries the column's border.
+    column_fmts = [datetime_fmt, datetime_fmt, hrs_fmt, eur_fmt, note_fmt]
+    for col_idx, fmt in enumerate(column_fmts):
+        values = dataset.iloc[:, col_idx]
+        worksheet.write_column(
+            1, col_idx, values.astype(object).where(values.notna(), None), fmt
+        )
 
-    # Corrected Formulas: Summing C (Duration) and D (Cost)
-    total_hrs_cell = ws.cell(
-        row=2, column=total_hours_col, value=f"=SUM(C2:C{last_row})"
-    )
-    total_cost_cell = ws.cell(
-        row=2, column=total_cost_col, value=f"=SUM(D2:D{last_row})"
-    )
+    # Adjust Column Widths
+    worksheet.set_column("A:B", 20)  # Start/End (Col A, B)
+    worksheet.set_column("C:D", 10)  # Duration, Cost (Col C, D)
+    worksheet.set_column("E:E", 30)  # Note (Col E)
 
-    # Styling Summary Area (G1:I2)
-    for col in range(7, 10):
-        for r in range(1, 3):
-            cell = ws.cell(row=r, column=col)
-            cell.border = thin_border
-            if r == 2 and col >= 8:
-                cell.fill = summary_fill
-                cell.font = bold_font
+    # 3. Dedicated Summary Section (Top Right, G1:I2)
+    worksheet.set_column("G:I", 15)
+    worksheet.write_blank(0, 6, None, border_fmt)
+    worksheet.write(0, 7, "TOTAL HOURS", bold_fmt)
+    worksheet.write(0, 8, "TOTAL COST", bold_fmt)
+    worksheet.write(1, 6, "TOTAL DUE:", summary_label_fmt)
 
-    total_hrs_cell.number_format = '0.00 "hrs"'
-    total_hrs_cell.alignment = Alignment(horizontal="center", vertical="center")
-    total_cost_cell.number_format = "€ #,##0.00"
-    total_cost_cell.alignment = Alignment(horizontal="center", vertical="center")
+    # Formulas: Summing C (Duration) and D (Cost)
+    worksheet.write_formula(1, 7, f"=SUM(C2:C{last_row})", summary_hrs_fmt)
+    worksheet.write_formula(1, 8, f"=SUM(D2:D{last_row})", summary_cost_fmt)
 
-    # Adjust Column Widths
-    widths = {"A": 20, "B": 20, "C": 10, "D": 10, "E": 30, "G": 15, "H": 15, "I": 15}
-    for col, width in widths.items():
-        ws.column_dimensions[col].width = width
 
-    wb.save(file_path)
+def save_excel(dataset: pd.DataFrame, file_path: Path) -> None:
+    """Write the dataset to Excel and style it in a single streaming pass."""
+    with Workbook(file_path) as workbook:
+        modify_excel(workbook, workbook.add_worksheet("Sheet1"), dataset)
 
 
 def main(
@@ -136,8 +132,7 @@ def main(
             "note": "Note",
         }
     )
-    processed_data.to_excel(output_excel_path, index=False)
-    modify_excel(output_excel_path)
+    save_excel(processed_data, output_excel_path)
     print(f"Data processed and saved to {output_excel_path}")
 
 
@@ -3,11 +3,10 @@
 import argparse
 from pathlib import Path
 
-from thesis_breath_frequency import logger
+from thesis_breath_frequency import get_project_paths, logger
 from thesis_breath_frequency.cleaning import load_and_process_excel
-from thesis_breath_frequency.project_configs import ProjectPaths
 
-project_paths = ProjectPaths()
+project_paths = get_project_paths()
 
 raw_data_path = project_paths.data_folder.raw.joinpath("Respiratorio CPET BR.xlsx")
 
@@ -2,16 +2,37 @@
 
 Expose the most useful symbols from the package so notebooks can import
 directly from the package without modifying `sys.path`.
+
+The project settings and the package logger are built lazily, on first
+access, so importing the package does not pay for settings validation.
 """
 
 import logging
+from functools import cache
 
 from .project_configs import LoggerConfiguration, ProjectPaths
 
-_project_paths = ProjectPaths()
-_logger_config = LoggerConfiguration()
-_loggerdict_config = _logger_config.generate(log_dir=_project_paths.logger_folder)
-logger = logging.getLogger(_logger_config.log_name)
-logger.setLevel(_logger_config.log_level)
 
-__all__ = ["ProjectPaths", "logger"]
+@cache
+def get_project_paths() -> ProjectPaths:
+    """Return the project paths, validated once on first call."""
+    return ProjectPaths()
+
+
+@cache
+def get_logger() -> logging.Logger:
+    """Return the package logger, configured once on first call."""
+    logger_config = LoggerConfiguration()
+    package_logger = logging.getLogger(logger_config.log_name)
+    package_logger.setLevel(logger_config.log_level)
+    return package_logger
+
+
+def __getattr__(name: str) -> logging.Logger:
+    # Keep `from thesis_breath_frequency import logger` working lazily
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["ProjectPaths", "get_logger", "get_project_paths", "logger"]
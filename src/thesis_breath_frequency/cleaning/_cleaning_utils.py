@@ -1,65 +1,83 @@
 import pandas as pd
 
+_RENAME_MAPPING = {
+    "work_(watts)": "work_watts",
+    "vo2_(ml/kg/min)": "vo2_ml_per_kg_min",
+    "vo2_(ml/min)": "vo2_ml_per_min",
+    "vco2_(ml/min)": "vco2_ml_per_min",
+    "rer": "rer",
+    "rr_(br/min)": "rr_br_per_min",
+    "vt_btps_(l)": "vt_btps_l",
+    "ve_btps_(l/min)": "ve_btps_l_per_min",
+    "br_(%)": "breathing_reserve_pct",
+    "hr_(bpm)": "hr_bpm",
+    "hrr_(%)": "hrr_pct",
+    "peto2_(mmhg)": "peto2_mmhg",
+    "petco2_(mmhg)": "petco2_mmhg",
+    "rr_(br/min)copy": "rr_br_per_min_copy",
+    "vo2/pred(%)": "vo2_pred_pct",
+    "ti/ttot": "ti_ttot_ratio",
+    "ti_(sec)": "ti_sec",
+    "te_(sec)": "te_sec",
+    "ttot_(sec)": "ttot_sec",
+    "msec": "rr_interval_msec",
+    "msec_diff_quad": "rr_interval_diff_squared_msec",
+    "rmssq": "rmssd_ms",
+    "patient": "patient_id",
+    "time_seconds": "time_seconds",
+}
+
+# Target dtype of every measurement column, keyed by its normalized name.
+# Whole-number measurements use the nullable Int64 so they stay integers
+# even when a sheet has missing cells.
+_NUMERIC_DTYPES = {
+    "work_(watts)": "Int64",
+    "vo2_(ml/kg/min)": "float64",
+    "vo2_(ml/min)": "Int64",
+    "vco2_(ml/min)": "Int64",
+    "rer": "float64",
+    "rr_(br/min)": "Int64",
+    "vt_btps_(l)": "float64",
+    "ve_btps_(l/min)": "float64",
+    "br_(%)": "float64",
+    "hr_(bpm)": "Int64",
+    "hrr_(%)": "float64",
+    "peto2_(mmhg)": "Int64",
+    "petco2_(mmhg)": "Int64",
+    "rr_(br/min)_copy": "Int64",
+    "vo2/pred_(%)": "Int64",
+    "ti/ttot": "float64",
+    "ti_(sec)": "float64",
+    "te_(sec)": "float64",
+    "ttot_(sec)": "float64",
+    "msec": "float64",
+    "msec_diff_quad": "float64",
+    "rmssq": "float64",
+}
+
 
 def normalize_columns(df_: pd.DataFrame) -> pd.DataFrame:
     df_.columns = [col.strip().lower().replace(" ", "_") for col in df_.columns]
     return df_
 
 
-def convert_time_to_seconds(time_str: str) -> int:
-    if isinstance(time_str, str):
-        hours, minutes, seconds = time_str.split(":")
-        minutes = int(minutes) + int(hours) * 60
-        seconds = int(seconds) + minutes * 60
-        return seconds
-    else:
-        raise ValueError(f"Expected a string in the format 'HH:MM:SS', got {time_str}")
-
-
-def correct_df_dtypes(df: pd.DataFrame) -> pd.DataFrame:
-    # 1. Strip whitespace from all string columns
-    str_cols = df.select_dtypes(include=["object", "string"]).columns
-    for col in str_cols:
-        df[col] = df[col].astype(str).str.strip()
+def convert_time_column_to_seconds(time_col: pd.Series) -> pd.Series:
+    """Convert a column of ``HH:MM:SS`` values to whole seconds.
 
-    # 2. Attempt to convert string columns to numeric where possible
-    for col in str_cols:
-        # check if the column is primarily digits/decimals
-        # errors='ignore' keeps it as string if it's not a number
-        converted = pd.to_numeric(df[col], errors="coerce")
+    Accepts strings or :class:`datetime.time` values and parses the whole
+    column in a single pandas call instead of dispatching a Python function
+    per row.
+    """
+    return pd.to_timedelta(time_col.astype("string")).dt.total_seconds().astype("int64")
 
-        # If the conversion didn't result in all NaNs (meaning it was actually numbers)
-        if not converted.isna().all():
-            df[col] = converted
 
+def cast_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Excel already stores measurements as numbers: cast them straight to
+    # their target dtype, coercing the odd text cell to NaN
+    for col, dtype in _NUMERIC_DTYPES.items():
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
     return df
 
 
 def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
-    rename_mapping = {
-        "work_(watts)": "work_watts",
-        "vo2_(ml/kg/min)": "vo2_ml_per_kg_min",
-        "vo2_(ml/min)": "vo2_ml_per_min",
-        "vco2_(ml/min)": "vco2_ml_per_min",
-        "rer": "rer",
-        "rr_(br/min)": "rr_br_per_min",
-        "vt_btps_(l)": "vt_btps_l",
-        "ve_btps_(l/min)": "ve_btps_l_per_min",
-        "br_(%)": "breathing_reserve_pct",
-        "hr_(bpm)": "hr_bpm",
-        "hrr_(%)": "hrr_pct",
-        "peto2_(mmhg)": "peto2_mmhg",
-        "petco2_(mmhg)": "petco2_mmhg",
-        "rr_(br/min)copy": "rr_br_per_min_copy",
-        "vo2/pred(%)": "vo2_pred_pct",
-        "ti/ttot": "ti_ttot_ratio",
-        "ti_(sec)": "ti_sec",
-        "te_(sec)": "te_sec",
-        "ttot_(sec)": "ttot_sec",
-        "msec": "rr_interval_msec",
-        "msec_diff_quad": "rr_interval_diff_squared_msec",
-        "rmssq": "rmssd_ms",
-        "patient": "patient_id",
-        "time_seconds": "time_seconds",
-    }
-    return df.rename(columns=rename_mapping)
+    return df.rename(columns=_RENAME_MAPPING)
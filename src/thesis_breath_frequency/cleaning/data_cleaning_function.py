@@ -4,28 +4,41 @@ This module provides helpers to read Excel files containing multiple
 patient sheets, normalize and convert columns, and return a single
 concatenated :class:`pandas.DataFrame` ready for downstream analysis.
 
+Classes
+-------
+SheetPlan
+    Per-sheet reading parameters, looked up by sheet name in ``SHEET_PLAN``.
+
 Functions
 ---------
-_get_skip_rows
-    Return the number of rows to skip for known sheet names.
+_read_sheet
+    Read the data block of a worksheet into a DataFrame.
+_clean_sheet
+    Normalize, filter and convert the raw rows of a single sheet.
 load_and_process_excel
     Load an Excel file, process each valid sheet and concatenate results.
 """
 
+from contextlib import closing
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from openpyxl import load_workbook
 
 import pandas as pd
 
-from ..__init__ import logger
+from .. import logger
 from ._cleaning_utils import (
-    convert_time_to_seconds,
-    correct_df_dtypes,
+    cast_numeric_columns,
+    convert_time_column_to_seconds,
     normalize_columns,
     rename_columns,
 )
 
+if TYPE_CHECKING:
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
 header = [
     "Time (min)",
     "Work (Watts)",
@@ -53,31 +66,69 @@ header = [
 ]
 
 
-def _get_skip_rows(sheet_name: str) -> int:
-    """Get the number of rows to skip for a given sheet name."""
-    skip_rows_map = {
-        "FG": 3,
-        "VR": 4,
-        "CN": 4,
-        "SG": 3,
-        "AA": 4,
-        "MS": 4,
-        "GE": 4,
-        "PT": 4,
-        "CM": 3,
-        "CN2": 4,
-        # "SM": 2,  # TODO: controlla SM
-        "CG": 3,
-        "MP": 3,
-        "IL": 4,
-        "GR": 4,
-        "VG": 4,
-        "GP": 4,
-        "CL": 4,
-        "GM": 4,
-        "SL": 4,
-    }
-    return skip_rows_map.get(sheet_name)
+@dataclass(slots=True, frozen=True)
+class SheetPlan:
+    """Reading parameters for one patient sheet.
+
+    Attributes
+    ----------
+    skiprows : int
+        Number of rows above the sheet's own header row.
+    """
+
+    skiprows: int
+
+
+SHEET_PLAN: dict[str, SheetPlan] = {
+    "FG": SheetPlan(skiprows=3),
+    "VR": SheetPlan(skiprows=4),
+    "CN": SheetPlan(skiprows=4),
+    "SG": SheetPlan(skiprows=3),
+    "AA": SheetPlan(skiprows=4),
+    "MS": SheetPlan(skiprows=4),
+    "GE": SheetPlan(skiprows=4),
+    "PT": SheetPlan(skiprows=4),
+    "CM": SheetPlan(skiprows=3),
+    "CN2": SheetPlan(skiprows=4),
+    # "SM": SheetPlan(skiprows=2),  # TODO: controlla SM
+    "CG": SheetPlan(skiprows=3),
+    "MP": SheetPlan(skiprows=3),
+    "IL": SheetPlan(skiprows=4),
+    "GR": SheetPlan(skiprows=4),
+    "VG": SheetPlan(skiprows=4),
+    "GP": SheetPlan(skiprows=4),
+    "CL": SheetPlan(skiprows=4),
+    "GM": SheetPlan(skiprows=4),
+    "SL": SheetPlan(skiprows=4),
+}
+
+
+def _read_sheet(worksheet: "ReadOnlyWorksheet", skip_to_row: int) -> pd.DataFrame:
+    """Read columns A:W of a worksheet, below its header row, as raw values.
+
+    Rows come straight from the read-only iterator as plain values, so no
+    styled ``Cell`` objects are built. The first row after ``skip_to_row`` is
+    the sheet's own header and is replaced by :data:`header`.
+    """
+    rows = worksheet.iter_rows(
+        min_row=skip_to_row + 2, max_col=len(header), values_only=True
+    )
+    return pd.DataFrame(list(rows), columns=header)
+
+
+def _clean_sheet(raw_sheet: pd.DataFrame, sheet_name: str) -> pd.DataFrame:
+    """Normalize, filter and convert the raw rows read from one sheet."""
+    return (
+        raw_sheet.pipe(normalize_columns)
+        .dropna(thresh=20)
+        .assign(
+            patient=sheet_name,
+            time_seconds=lambda df_: convert_time_column_to_seconds(df_["time_(min)"]),
+        )
+        .drop(columns=["time_(min)"])
+        .pipe(cast_numeric_columns)
+        .pipe(rename_columns)
+    )
 
 
 def load_and_process_excel(source_excel_path: Path) -> pd.DataFrame:
@@ -92,32 +143,24 @@ def load_and_process_excel(source_excel_path: Path) -> pd.DataFrame:
         A concatenated DataFrame with processed data from all valid sheets.
     """
     dataframes = []
-    for sheet_name in load_workbook(source_excel_path, read_only=True).sheetnames:
-        logger.info(f"Processing sheet: {sheet_name}")
-        skip_to_row = _get_skip_rows(sheet_name)
-        if skip_to_row is None:
-            logger.warning(f"No skip row defined for sheet '{sheet_name}'. Skipping this sheet.")
-            continue
-        logger.debug(f"Processing sheet '{sheet_name}' with skip_to_row={skip_to_row}")
-
-        dataframes.append(
-            pd.read_excel(
-                source_excel_path,
-                sheet_name=sheet_name,
-                skiprows=skip_to_row,
-                usecols="A:W",
-                names=header,
-                dtype="string",
-            )
-            .pipe(normalize_columns)
-            .dropna(thresh=20)
-            .assign(
-                patient=sheet_name,
-                time_seconds=lambda df_: df_["time_(min)"].apply(convert_time_to_seconds),
-            )
-            .drop(columns=["time_(min)"])
-            .pipe(correct_df_dtypes)
-            .pipe(rename_columns)
-        )
+    # Open the workbook once and reuse the handle for every sheet: each
+    # read-only open rescans the dimensions of every sheet in the file.
+    with closing(
+        load_workbook(source_excel_path, read_only=True, data_only=True)
+    ) as workbook:
+        for sheet_name in workbook.sheetnames:
+            logger.info(f"Processing sheet: {sheet_name}")
+            plan = SHEET_PLAN.get(sheet_name)
+            if plan is None:
+                logger.warning(
+                    f"No plan defined for sheet '{sheet_name}'. Skipping this sheet."
+                )
+                continue
+            logger.debug(f"Processing sheet '{sheet_name}' with {plan}")
+
+            raw_sheet = _read_sheet(workbook[sheet_name], plan.skiprows)
+            dataframes.append(_clean_sheet(raw_sheet, sheet_name))
     logger.info(f"Processed {len(dataframes)} sheets from the Excel file.")
-    return pd.concat(dataframes)
\ No newline at end of file
+    # Per-sheet indexes carry no meaning once stacked; ignoring them lets
+    # concat skip building a (duplicated) combined index.
+    return pd.concat(dataframes, ignore_index=True)
@@ -90,15 +90,11 @@ class DataFolderSettings(BaseSettings):
             ValueError: If data_root is missing or invalid type.
         """
         root_folder: str | Path | None = values.get("data_root")
-        if not root_folder:
-            raise ValueError("Root folder should be present.")
-
         if not root_folder:
             raise ValueError("data_root folder cannot be None")
-        elif isinstance(root_folder, str):
-            root_folder = Path(root_folder)
-        elif not isinstance(root_folder, Path):
+        if not isinstance(root_folder, str | Path):
             raise ValueError("Data root folder can only be of type str or Path.")
+        root_folder = Path(root_folder)
 
         for folder_name in ["external", "interim", "processed", "raw"]:
             if not values.get(folder_name):
@@ -158,10 +154,9 @@ class ReportFolderSettings(BaseSettings):
         root_folder: str | Path | None = values.get("report_root")
         if not root_folder:
             raise ValueError("report_root folder cannot be None")
-        elif isinstance(root_folder, str):
-            root_folder = Path(root_folder)
-        elif not isinstance(root_folder, Path):
+        if not isinstance(root_folder, str | Path):
             raise ValueError("Report root folder can only be of type str or Path.")
+        root_folder = Path(root_folder)
 
         for folder_name in ["figures", "tables"]:
             if not values.get(folder_name):
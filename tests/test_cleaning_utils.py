@@ -0,0 +1,47 @@
+"""Tests for the sheet cleaning helpers."""
+
+from datetime import time
+
+import pytest
+
+import pandas as pd
+
+from thesis_breath_frequency.cleaning._cleaning_utils import (
+    convert_time_column_to_seconds,
+)
+
+
+def test_convert_time_column_to_seconds_from_time_values() -> None:
+    """Excel time cells arrive from openpyxl as ``datetime.time`` values."""
+    time_col = pd.Series([time(0, 0, 0), time(0, 4, 8), time(4, 8, 0)])
+
+    result = convert_time_column_to_seconds(time_col)
+
+    assert result.dtype == "int64"
+    assert result.tolist() == [0, 248, 14880]
+
+
+def test_convert_time_column_to_seconds_from_strings() -> None:
+    """Text cells in ``HH:MM:SS`` form are parsed the same way."""
+    time_col = pd.Series(["00:00:30", "01:02:03"], dtype="string")
+
+    result = convert_time_column_to_seconds(time_col)
+
+    assert result.tolist() == [30, 3723]
+
+
+def test_convert_time_column_to_seconds_keeps_index() -> None:
+    """The result aligns with the rows left after filtering."""
+    time_col = pd.Series(["00:01:00", "00:02:00"], index=[3, 7])
+
+    result = convert_time_column_to_seconds(time_col)
+
+    assert result.index.tolist() == [3, 7]
+
+
+def test_convert_time_column_to_seconds_rejects_malformed_values() -> None:
+    """Malformed times raise instead of silently becoming NaN."""
+    time_col = pd.Series(["00:01:00", "Avvio Esercizio"])
+
+    with pytest.raises(ValueError):
+        convert_time_column_to_seconds(time_col)
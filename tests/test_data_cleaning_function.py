@@ -0,0 +1,66 @@
+"""Tests for reading patient sheets from the Excel workbook."""
+
+from contextlib import closing
+from datetime import time
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from thesis_breath_frequency.cleaning import load_and_process_excel
+from thesis_breath_frequency.cleaning.data_cleaning_function import (
+    SHEET_PLAN,
+    _read_sheet,
+    header,
+)
+
+N_MEASUREMENTS = len(header) - 1
+
+
+def _data_row(minutes: int, value: float) -> list:
+    return [time(0, minutes, 8), *[value] * N_MEASUREMENTS]
+
+
+@pytest.fixture
+def workbook_path(tmp_path: Path) -> Path:
+    """Workbook shaped like the raw data: title rows, a header, then data."""
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "FG"
+    skiprows = SHEET_PLAN["FG"].skiprows
+
+    for row_idx in range(1, skiprows + 1):
+        worksheet.append([f"title row {row_idx}"])
+    worksheet.append(header)
+    worksheet.append(_data_row(minutes=4, value=1.0))
+    worksheet.append(_data_row(minutes=5, value=2.0))
+
+    unplanned = workbook.create_sheet("Breathing-Rate Variability")
+    unplanned.append(["not a patient sheet"])
+
+    path = tmp_path / "raw.xlsx"
+    workbook.save(path)
+    return path
+
+
+def test_read_sheet_starts_at_first_data_row(workbook_path: Path) -> None:
+    """The sheet's own header row is skipped and the first data row kept."""
+    with closing(
+        load_workbook(workbook_path, read_only=True, data_only=True)
+    ) as workbook:
+        raw_sheet = _read_sheet(workbook["FG"], SHEET_PLAN["FG"].skiprows)
+
+    assert raw_sheet.columns.tolist() == header
+    assert len(raw_sheet) == 2
+    assert raw_sheet.iloc[0, 0] == time(0, 4, 8)
+    assert raw_sheet.iloc[0, 1] == 1.0
+
+
+def test_load_and_process_excel(workbook_path: Path) -> None:
+    """Known sheets are cleaned and stacked; unknown sheets are skipped."""
+    result = load_and_process_excel(workbook_path)
+
+    assert result["patient_id"].tolist() == ["FG", "FG"]
+    assert result["time_seconds"].tolist() == [248, 308]
+    assert result["work_watts"].tolist() == [1.0, 2.0]
+    assert result.index.tolist() == [0, 1]